@@ -33,10 +33,16 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.25.0",
+        "urllib3>=1.26.0",
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "fast": [
+            "orjson>=3.6",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.12.0",
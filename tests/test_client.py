@@ -0,0 +1,113 @@
+"""
+TNKB Client - Client Tests
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tnkb import TNKBClient
+
+API_SUCCESS = {'success': True, 'data': {'region_code': 'B', 'vehicle_type': 'Motor'}}
+
+
+@pytest.fixture
+def client():
+    with TNKBClient() as client:
+        yield client
+
+
+@pytest.fixture
+def api_server():
+    """Local API returning queued (status, headers) responses, then 200"""
+    responses = []
+    hits = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            status, headers = responses.pop(0) if responses else (200, {})
+            body = json.dumps(API_SUCCESS).encode() if status == 200 else b''
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+    )
+    thread.start()
+    server.responses = responses
+    server.hits = hits
+    server.endpoint = f"http://127.0.0.1:{server.server_port}/check"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_server_client(api_server, **kwargs):
+    client = TNKBClient(timeout=5, **kwargs)
+    client.CHECK_KENDARAAN_ENDPOINT = api_server.endpoint
+    return client
+
+
+@pytest.mark.parametrize('plate', [
+    'B 1234 ABC',
+    'b 1234 abc',
+    '  B 1234 ABC ',
+    'B  1234 ABC',
+    'B1234ABC',
+])
+def test_validate_plate_normalizes_like_check_plate(client, plate):
+    assert client.validate_plate(plate) is True
+
+
+@pytest.mark.parametrize('plate', ['', 'INVALID', 'XYZ', '12345', 'B 12345 ABC'])
+def test_validate_plate_rejects_invalid_format(client, plate):
+    assert client.validate_plate(plate) is False
+
+
+def test_bulk_check_async_retries_503(api_server):
+    pytest.importorskip('aiohttp')
+    api_server.responses.append((503, {}))
+    client = make_server_client(api_server, max_retries=3)
+    
+    vehicle, = asyncio.run(client.bulk_check_async(['B 1234 ABC']))
+    
+    assert len(api_server.hits) == 2
+    assert vehicle.vehicle_type == 'Motor'
+    assert vehicle.details == API_SUCCESS['data']
+
+
+def test_bulk_check_async_honours_retry_after(api_server):
+    pytest.importorskip('aiohttp')
+    api_server.responses.append((503, {'Retry-After': '1'}))
+    client = make_server_client(api_server, max_retries=3)
+    
+    started = time.monotonic()
+    vehicle, = asyncio.run(client.bulk_check_async(['B 1234 ABC']))
+    
+    assert time.monotonic() - started >= 1
+    assert len(api_server.hits) == 2
+    assert vehicle.vehicle_type == 'Motor'
+
+
+def test_bulk_check_async_falls_back_after_max_retries(api_server):
+    pytest.importorskip('aiohttp')
+    api_server.responses.extend([(503, {}), (503, {})])
+    client = make_server_client(api_server, max_retries=1)
+    
+    vehicle, = asyncio.run(client.bulk_check_async(['B 1234 ABC']))
+    
+    assert len(api_server.hits) == 2
+    assert vehicle.details['source'] == 'local_parsing'
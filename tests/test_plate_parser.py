@@ -0,0 +1,49 @@
+"""
+TNKB Client - Plate Parser Tests
+"""
+
+import random
+import re
+
+import pytest
+
+from tnkb.client import _parse_plate_fast
+
+# Grammar of TNKBClient.PLATE_PATTERN applied to the normalized plate, as
+# the client did before the regex was replaced
+REFERENCE_PATTERN = re.compile(r'^([A-Z]{1,2})\s?(\d{1,4})\s?([A-Z]{1,3})$', re.ASCII)
+
+
+def reference_parse(plate_number):
+    normalized = ' '.join(plate_number.upper().split())
+    match = REFERENCE_PATTERN.match(normalized)
+    return match.groups() if match else None
+
+
+@pytest.mark.parametrize('plate, expected', [
+    ('B 1234 ABC', ('B', '1234', 'ABC')),
+    ('b 1234 abc', ('B', '1234', 'ABC')),
+    ('  AB   5\tCDE ', ('AB', '5', 'CDE')),
+    ('B1234ABC', ('B', '1234', 'ABC')),
+    ('B 1234ABC', ('B', '1234', 'ABC')),
+    ('B1234 ABC', ('B', '1234', 'ABC')),
+    ('INVALID', None),
+    ('XYZ', None),
+    ('12345', None),
+    ('ABC 1 A', None),
+    ('B 12345 A', None),
+    ('B 1 ABCD', None),
+    ('B 12 34 A', None),
+    ('B1 2A', None),
+    ('É 1 A', None),
+])
+def test_parse_plate_fast_known_plates(plate, expected):
+    assert _parse_plate_fast(plate) == expected
+
+
+def test_parse_plate_fast_matches_reference_on_random_input():
+    rng = random.Random(1234)
+    alphabet = 'ABCZabz0129 \t'
+    for _ in range(50000):
+        plate = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert _parse_plate_fast(plate) == reference_parse(plate), plate
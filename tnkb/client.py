@@ -3,22 +3,85 @@ TNKB Client - Main API Client
 """
 
 import re
+import copy
+import json
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import quote
 
-import requests
-from requests.adapters import HTTPAdapter
+import urllib3
 from urllib3.util.retry import Retry
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
 from .exceptions import (
     TNKBError, InvalidPlateError, APIError, 
     NetworkError, TimeoutError as TNKBTimeoutError, ValidationError
 )
-from .models import VehicleInfo, REGION_CODES
+from .models import VehicleInfo, REGION_CODES, REGION_NAME, REGIONS_SORTED
 
 logger = logging.getLogger(__name__)
 
+# Fallback for plates written without the usual spaces, e.g. 'B1234ABC'
+_COMPACT_PLATE_PATTERN = re.compile(r'([A-Z]{1,2}) ?([0-9]{1,4}) ?([A-Z]{1,3})')
+
+
+def _parse_plate_fast(plate_number: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a plate into (region_code, digits, letters)
+    
+    Accepts the same grammar as TNKBClient.PLATE_PATTERN, restricted to
+    ASCII letters and digits. The common 'B 1234 ABC' form is checked with
+    str methods only; other spacings fall back to one regex match.
+    
+    Returns:
+        tuple: Plate components, or None if the format is invalid
+    """
+    parts = plate_number.upper().split()
+    if len(parts) == 3:
+        region_code, digits, letters = parts
+        if (len(region_code) <= 2 and region_code.isascii() and region_code.isalpha()
+                and len(digits) <= 4 and digits.isascii() and digits.isdigit()
+                and len(letters) <= 3 and letters.isascii() and letters.isalpha()):
+            return region_code, digits, letters
+        return None
+    
+    match = _COMPACT_PLATE_PATTERN.fullmatch(' '.join(parts))
+    return match.groups() if match else None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_and_parse_cached(
+    plate_number: str
+) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Parse a raw plate and build its normalized form, memoized on the input
+    
+    Returns:
+        tuple: (normalized_plate, region_code, digits, letters), or None
+        if the format is invalid
+    """
+    parts = _parse_plate_fast(plate_number)
+    if parts is None:
+        return None
+    
+    region_code, digits, letters = parts
+    return f"{region_code} {digits} {letters}", region_code, digits, letters
+
 
 class TNKBClient:
     """
@@ -35,10 +98,31 @@ class TNKBClient:
     CHECK_KENDARAAN_ENDPOINT = f"{API_BASE_URL}/check"
     CEK_NOPOL_ENDPOINT = f"{API_BASE_URL}/check"
     
+    # Headers sent with every request
+    _DEFAULT_HEADERS = MappingProxyType({
+        'User-Agent': 'TNKBClient/1.0.0 (Python)',
+        'Content-Type': 'application/json',
+        'X-RapidAPI-Host': 'cek-nopol-kendaraan.p.rapidapi.com',
+    })
+    
     # Plate validation regex
     # Format: [LETTER] [1-4 DIGITS] [LETTER(S)]
+    # Reference grammar only; validation uses _parse_plate_fast()
     PLATE_PATTERN = re.compile(r'^([A-Z]{1,2})\s?(\d{1,4})\s?([A-Z]{1,3})$')
     
+    # Max simultaneous connections used by bulk_check_async
+    ASYNC_CONNECTION_LIMIT = 64
+    
+    # Number of check_plate results kept per client
+    CACHE_SIZE = 1024
+    
+    # Connections kept open per host by the connection pool
+    POOL_MAXSIZE = 32
+    
+    # Retry policy shared by the sync and async request paths
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    RETRY_BACKOFF_FACTOR = 1
+    
     def __init__(
         self,
         timeout: int = 10,
@@ -56,37 +140,43 @@ class TNKBClient:
             rapidapi_key: Optional RapidAPI key for authenticated requests
         """
         self.timeout = timeout
+        self.max_retries = max_retries
         self.verify_ssl = verify_ssl
         self.rapidapi_key = rapidapi_key
         
-        # Setup session with retries
-        self.session = requests.Session()
-        retry_strategy = Retry(
+        # Set default headers
+        self.headers = dict(self._DEFAULT_HEADERS)
+        if rapidapi_key:
+            self.headers['X-RapidAPI-Key'] = rapidapi_key
+        
+        # Setup connection pool with retries
+        self._retry = Retry(
             total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=list(self.RETRY_STATUS_CODES),
             allowed_methods=["GET", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': 'TNKBClient/1.0.0 (Python)',
-            'Content-Type': 'application/json',
-            'X-RapidAPI-Host': 'cek-nopol-kendaraan.p.rapidapi.com',
-        })
+        self.pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=self.POOL_MAXSIZE,
+            retries=self._retry,
+            timeout=urllib3.Timeout(total=timeout),
+            cert_reqs='CERT_REQUIRED' if verify_ssl else 'CERT_NONE',
+            headers=self.headers,
+        )
         
-        if self.rapidapi_key:
-            self.session.headers.update({
-                'X-RapidAPI-Key': self.rapidapi_key
-            })
+        # Per-instance cache of API results keyed on normalized plate
+        self._checked_cached = lru_cache(maxsize=self.CACHE_SIZE)(
+            self._check_plate_uncached
+        )
     
     def check_plate(self, plate_number: str) -> VehicleInfo:
         """
         Check and decode Indonesian vehicle plate number
         
+        API results are cached per normalized plate. Every call returns
+        its own copy, so callers may modify the result freely.
+        
         Args:
             plate_number: Vehicle plate number (e.g., 'B 1234 ABC')
             
@@ -102,39 +192,34 @@ class TNKBClient:
             >>> vehicle = client.check_plate('B 1234 ABC')
             >>> print(f"Region: {vehicle.region_name}")
         """
-        # Validate and normalize plate
-        normalized_plate = self._normalize_plate(plate_number)
-        
-        # Parse plate components
-        region_code, digits, letters = self._parse_plate(normalized_plate)
+        # Validate, normalize and parse plate in one pass
+        normalized_plate, region_code, digits, letters = (
+            self._normalize_and_parse(plate_number)
+        )
         
         try:
-            # Try API call first
-            response = self._call_api(
-                self.CHECK_KENDARAAN_ENDPOINT,
-                {'nopol': normalized_plate}
-            )
-            return self._build_vehicle_info(response, normalized_plate)
+            # Try API call first (cached per normalized plate)
+            return self._copy_vehicle(self._checked_cached(normalized_plate))
         except APIError as e:
-            logger.warning(f"API call failed: {e}, falling back to local parsing")
-            # Fallback to local parsing if API fails
+            logger.warning("API call failed: %s, falling back to local parsing", e)
+            # Fallback to local parsing if API fails; not cached so the
+            # API is retried on the next call
             return self._parse_locally(normalized_plate, region_code, digits)
     
     def validate_plate(self, plate_number: str) -> bool:
         """
         Validate Indonesian vehicle plate format
         
+        The plate is normalized exactly as check_plate() does, so case and
+        extra whitespace are ignored ('b  1234 abc' is valid).
+        
         Args:
             plate_number: Vehicle plate number to validate
             
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            self._validate_plate_format(plate_number)
-            return True
-        except InvalidPlateError:
-            return False
+        return self._is_valid_plate(plate_number)
     
     def get_region_info(self, region_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -146,10 +231,10 @@ class TNKBClient:
         Returns:
             dict: Region information or None if not found
         """
-        region_code = region_code.upper()
+        # Most callers already pass an uppercase code
         if region_code in REGION_CODES:
             return REGION_CODES[region_code]
-        return None
+        return REGION_CODES.get(region_code.upper())
     
     def list_regions(self) -> List[Dict[str, str]]:
         """
@@ -158,65 +243,206 @@ class TNKBClient:
         Returns:
             list: List of all regions with codes and names
         """
-        return [
-            {
-                'code': code,
-                'name': info['name'],
-                'province': info.get('province', '')
-            }
-            for code, info in sorted(REGION_CODES.items())
-        ]
+        return [dict(region) for region in REGIONS_SORTED]
+    
+    def cache_clear(self) -> None:
+        """Clear cached check_plate results"""
+        self._checked_cached.cache_clear()
+    
+    def cache_info(self):
+        """
+        Get check_plate cache statistics
+        
+        The async methods do not use this cache.
+        
+        Returns:
+            CacheInfo: Named tuple of hits, misses, maxsize and currsize
+        """
+        return self._checked_cached.cache_info()
     
-    def bulk_check(self, plate_numbers: List[str]) -> List[VehicleInfo]:
+    def bulk_check(
+        self,
+        plate_numbers: List[str],
+        max_workers: int = 8
+    ) -> List[VehicleInfo]:
         """
         Check multiple plate numbers
         
+        Plates are checked on a thread pool so API round trips overlap.
+        Duplicate plates share a single lookup but each get their own
+        VehicleInfo. Use bulk_check_async() from async code.
+        
         Args:
             plate_numbers: List of plate numbers to check
+            max_workers: Number of worker threads (default: 8)
             
         Returns:
-            list: List of VehicleInfo objects
+            list: List of VehicleInfo objects, in input order
         """
+        # Only this thread submits work, so the in-flight map needs no lock
+        inflight: Dict[Any, Future] = {}
+        keys = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for plate in plate_numbers:
+                key = self._dedupe_key(plate)
+                if key not in inflight:
+                    inflight[key] = executor.submit(self._safe_check, key)
+                keys.append(key)
+        
         results = []
-        for plate in plate_numbers:
-            try:
-                results.append(self.check_plate(plate))
-            except TNKBError as e:
-                logger.error(f"Failed to check plate {plate}: {e}")
-                results.append(self._create_invalid_vehicle(plate, str(e)))
+        seen = set()
+        for key in keys:
+            vehicle = inflight[key].result()
+            if key in seen:
+                vehicle = self._copy_vehicle(vehicle)
+            seen.add(key)
+            results.append(vehicle)
         return results
     
-    # Private methods
+    async def check_plate_async(
+        self,
+        session: "aiohttp.ClientSession",
+        plate_number: str
+    ) -> VehicleInfo:
+        """
+        Check and decode a plate number using an aiohttp session
+        
+        Results are not read from or stored in the check_plate cache.
+        
+        Args:
+            session: Open aiohttp.ClientSession used for the request
+            plate_number: Vehicle plate number (e.g., 'B 1234 ABC')
+            
+        Returns:
+            VehicleInfo: Decoded vehicle information
+            
+        Raises:
+            InvalidPlateError: If plate format is invalid
+        """
+        normalized_plate, region_code, digits, letters = (
+            self._normalize_and_parse(plate_number)
+        )
+        
+        try:
+            response = await self._call_api_async(
+                session,
+                self.CHECK_KENDARAAN_ENDPOINT,
+                {'nopol': normalized_plate}
+            )
+            return self._build_vehicle_info(response, normalized_plate)
+        except APIError as e:
+            logger.warning("API call failed: %s, falling back to local parsing", e)
+            return self._parse_locally(normalized_plate, region_code, digits)
     
-    def _normalize_plate(self, plate_number: str) -> str:
-        """Normalize plate number format"""
-        if not plate_number:
-            raise InvalidPlateError("Plate number cannot be empty")
+    async def bulk_check_async(self, plate_numbers: List[str]) -> List[VehicleInfo]:
+        """
+        Check multiple plate numbers concurrently
         
-        # Remove extra whitespace and convert to uppercase
-        normalized = ' '.join(plate_number.upper().split())
+        All requests share one aiohttp session and run on the current
+        event loop, so total latency is close to a single round trip.
+        Duplicate plates share a single request but each get their own
+        VehicleInfo. Results are not read from or stored in the
+        check_plate cache.
+        
+        Args:
+            plate_numbers: List of plate numbers to check
+            
+        Returns:
+            list: List of VehicleInfo objects, in input order
+            
+        Raises:
+            TNKBError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise TNKBError(
+                "bulk_check_async requires aiohttp: pip install tnkb-client[async]"
+            )
         
-        # Validate format
-        self._validate_plate_format(normalized)
+        connector = aiohttp.TCPConnector(
+            limit=self.ASYNC_CONNECTION_LIMIT,
+            ssl=None if self.verify_ssl else False,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+        ) as session:
+            inflight: Dict[Any, "asyncio.Task"] = {}
+            keys = []
+            for plate in plate_numbers:
+                key = self._dedupe_key(plate)
+                if key not in inflight:
+                    inflight[key] = asyncio.create_task(
+                        self.check_plate_async(session, key)
+                    )
+                keys.append(key)
+            outcomes = dict(zip(
+                inflight,
+                await asyncio.gather(*inflight.values(), return_exceptions=True)
+            ))
         
-        return normalized
+        results = []
+        seen = set()
+        for plate, key in zip(plate_numbers, keys):
+            outcome = outcomes[key]
+            if isinstance(outcome, TNKBError):
+                logger.error("Failed to check plate %s: %s", plate, outcome)
+                outcome = self._create_invalid_vehicle(plate, str(outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            elif key in seen:
+                outcome = self._copy_vehicle(outcome)
+            seen.add(key)
+            results.append(outcome)
+        return results
+    
+    # Private methods
+    
+    def _dedupe_key(self, plate_number: str) -> Any:
+        """Key under which duplicate plates share one lookup in bulk checks"""
+        parsed = _normalize_and_parse_cached(plate_number) if plate_number else None
+        # Invalid plates keep their raw value so errors report the input
+        return parsed[0] if parsed else plate_number
+    
+    def _safe_check(self, plate_number: str) -> VehicleInfo:
+        """Check a plate, returning an invalid VehicleInfo on TNKB errors"""
+        try:
+            return self.check_plate(plate_number)
+        except TNKBError as e:
+            logger.error("Failed to check plate %s: %s", plate_number, e)
+            return self._create_invalid_vehicle(plate_number, str(e))
     
-    def _validate_plate_format(self, plate_number: str) -> None:
-        """Validate plate number format"""
-        if not self.PLATE_PATTERN.match(plate_number):
+    def _normalize_and_parse(self, plate_number: str) -> Tuple[str, str, str, str]:
+        """
+        Validate, normalize and parse a plate number in one pass
+        
+        Returns:
+            tuple: (normalized_plate, region_code, digits, letters), where
+            normalized_plate is the canonical 'B 1234 ABC' form
+        """
+        if not plate_number:
+            raise InvalidPlateError("Plate number cannot be empty")
+        
+        parsed = _normalize_and_parse_cached(plate_number)
+        if parsed is None:
             raise InvalidPlateError(
                 f"Invalid plate format: {plate_number}. "
                 f"Expected format: '[A-Z] [1-4 DIGITS] [A-Z]' (e.g., 'B 1234 ABC')"
             )
+        return parsed
     
-    def _parse_plate(self, plate_number: str) -> tuple:
-        """Parse plate into components"""
-        match = self.PLATE_PATTERN.match(plate_number)
-        if not match:
-            raise InvalidPlateError(f"Cannot parse plate: {plate_number}")
-        
-        region_code, digits, letters = match.groups()
-        return region_code, digits, letters
+    def _is_valid_plate(self, plate_number: str) -> bool:
+        """Check plate format without raising"""
+        if not plate_number:
+            return False
+        return _normalize_and_parse_cached(plate_number) is not None
+    
+    def _check_plate_uncached(self, normalized_plate: str) -> VehicleInfo:
+        """Look up a normalized plate via the API (wrapped by the cache)"""
+        response = self._call_api(
+            self.CHECK_KENDARAAN_ENDPOINT,
+            {'nopol': normalized_plate}
+        )
+        return self._build_vehicle_info(response, normalized_plate)
     
     def _call_api(
         self,
@@ -240,51 +466,155 @@ class TNKBClient:
         """
         try:
             if method.upper() == 'GET':
-                response = self.session.get(
-                    endpoint,
-                    params=params,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
-                )
+                response = self.pool.request('GET', endpoint, fields=params)
             else:
-                response = self.session.post(
+                response = self.pool.request(
+                    'POST',
                     endpoint,
-                    json=params,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
+                    body=json.dumps(params).encode('utf-8'),
                 )
             
-            response.raise_for_status()
+            if response.status >= 400:
+                raise APIError(f"API request failed: HTTP {response.status}")
             
-            data = response.json()
+            data = _loads(response.data)
             
             if not data.get('success'):
                 raise APIError(f"API error: {data.get('message', 'Unknown error')}")
             
             return data.get('data', data)
             
-        except requests.exceptions.Timeout:
+        except urllib3.exceptions.MaxRetryError as e:
+            raise self._translate_http_error(e.reason or e)
+        except urllib3.exceptions.HTTPError as e:
+            raise self._translate_http_error(e)
+        except ValueError as e:
+            raise APIError(f"Invalid API response: {e}")
+    
+    def _translate_http_error(self, error: Exception) -> APIError:
+        """Map a urllib3 exception to the matching TNKB exception"""
+        # NewConnectionError subclasses ConnectTimeoutError, so check it first
+        if isinstance(error, (
+            urllib3.exceptions.NewConnectionError,
+            urllib3.exceptions.ProtocolError,
+            urllib3.exceptions.ProxyError,
+            urllib3.exceptions.SSLError,
+        )):
+            return NetworkError(f"Network connection error: {error}")
+        if isinstance(error, urllib3.exceptions.TimeoutError):
+            return TNKBTimeoutError(f"API request timeout after {self.timeout}s")
+        return APIError(f"API request failed: {error}")
+    
+    async def _call_api_async(
+        self,
+        session: "aiohttp.ClientSession",
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Make async GET request with the same retries and error handling
+        as _call_api
+        
+        Args:
+            session: Open aiohttp.ClientSession
+            endpoint: API endpoint URL
+            params: Request parameters
+            
+        Returns:
+            dict: API response
+            
+        Raises:
+            APIError: If request fails
+        """
+        try:
+            body = await self._get_with_retries_async(session, endpoint, params)
+            data = _loads(body)
+            
+            if not data.get('success'):
+                raise APIError(f"API error: {data.get('message', 'Unknown error')}")
+            
+            return data.get('data', data)
+            
+        except asyncio.TimeoutError:
             raise TNKBTimeoutError(f"API request timeout after {self.timeout}s")
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             raise NetworkError(f"Network connection error: {e}")
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             raise APIError(f"API request failed: {e}")
         except ValueError as e:
             raise APIError(f"Invalid API response: {e}")
     
+    async def _get_with_retries_async(
+        self,
+        session: "aiohttp.ClientSession",
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> bytes:
+        """
+        GET the endpoint, retrying like the urllib3 Retry used by _call_api
+        
+        Retries connection errors, timeouts and RETRY_STATUS_CODES up to
+        max_retries times with the same exponential backoff. A Retry-After
+        header on 429/503 responses replaces the backoff delay.
+        
+        Raises:
+            APIError: If the final response has an error status
+        """
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                async with session.get(
+                    endpoint,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    status = response.status
+                    if (status not in self.RETRY_STATUS_CODES
+                            or attempt >= self.max_retries):
+                        if status >= 400:
+                            raise APIError(f"API request failed: HTTP {status}")
+                        return await response.read()
+                    if status in Retry.RETRY_AFTER_STATUS_CODES:
+                        retry_after = self._retry_after_delay(
+                            response.headers.get('Retry-After')
+                        )
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                if attempt >= self.max_retries:
+                    raise
+            
+            attempt += 1
+            if retry_after is not None:
+                await asyncio.sleep(retry_after)
+            elif attempt > 1:
+                # urllib3 retries once immediately, then doubles the delay
+                await asyncio.sleep(self.RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1))
+    
+    def _retry_after_delay(self, value: Optional[str]) -> Optional[float]:
+        """Seconds to wait for a Retry-After header, or None to use the backoff"""
+        if not value:
+            return None
+        try:
+            return self._retry.parse_retry_after(value)
+        except urllib3.exceptions.InvalidHeader:
+            return None
+    
     def _build_vehicle_info(
         self,
         api_response: Dict[str, Any],
         plate_number: str
     ) -> VehicleInfo:
         """Build VehicleInfo from API response"""
-        region_code = api_response.get('region_code', '').upper()
-        region_info = REGION_CODES.get(region_code, {})
+        region_code = api_response.get('region_code', '')
+        region_name = REGION_NAME.get(region_code)
+        if region_name is None:
+            region_code = region_code.upper()
+            region_name = REGION_NAME.get(region_code, 'Unknown')
         
         return VehicleInfo(
             plate_number=plate_number,
             region_code=region_code,
-            region_name=region_info.get('name', 'Unknown'),
+            region_name=region_name,
             vehicle_type=api_response.get('vehicle_type', 'Unknown'),
             is_valid=True,
             details=api_response,
@@ -297,13 +627,11 @@ class TNKBClient:
         digits: str
     ) -> VehicleInfo:
         """Parse plate locally when API is unavailable"""
-        region_code = region_code.upper()
-        region_info = REGION_CODES.get(region_code, {})
-        
+        # region_code comes from _normalize_and_parse and is already uppercase
         return VehicleInfo(
             plate_number=plate_number,
             region_code=region_code,
-            region_name=region_info.get('name', 'Unknown Region'),
+            region_name=REGION_NAME.get(region_code, 'Unknown Region'),
             vehicle_type='Car',  # Default
             is_valid=True,
             details={
@@ -314,6 +642,10 @@ class TNKBClient:
             }
         )
     
+    def _copy_vehicle(self, vehicle: VehicleInfo) -> VehicleInfo:
+        """Copy a VehicleInfo, including its details, keeping created_at"""
+        return replace(vehicle, details=copy.deepcopy(vehicle.details))
+    
     def _create_invalid_vehicle(self, plate: str, error: str) -> VehicleInfo:
         """Create invalid vehicle info object"""
         return VehicleInfo(
@@ -326,9 +658,9 @@ class TNKBClient:
         )
     
     def close(self) -> None:
-        """Close session and cleanup"""
-        if self.session:
-            self.session.close()
+        """Close pooled connections and cleanup"""
+        if self.pool:
+            self.pool.clear()
     
     def __enter__(self):
         """Context manager support"""
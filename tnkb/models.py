@@ -2,12 +2,18 @@
 TNKB Models - Data Classes
 """
 
+import sys
+from types import MappingProxyType
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions keep __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class VehicleInfo:
     """Vehicle information from TNKB"""
     
@@ -42,7 +48,7 @@ class VehicleInfo:
         return f"VehicleInfo(plate='{self.plate_number}', region='{self.region_name}', valid={self.is_valid})"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RegionInfo:
     """Indonesian vehicle registration region"""
     
@@ -61,7 +67,7 @@ class RegionInfo:
 
 
 # Indonesian region codes mapping
-REGION_CODES = {
+_REGION_CODES = {
     'A': {'name': 'DKI Jakarta', 'province': 'Jakarta'},
     'B': {'name': 'Jawa Barat', 'province': 'West Java'},
     'C': {'name': 'Jawa Tengah', 'province': 'Central Java'},
@@ -112,3 +118,19 @@ REGION_CODES = {
     'KB': {'name': 'Jayapura', 'province': 'Papua'},
     'PA': {'name': 'Pontianak', 'province': 'West Kalimantan'},
 }
+
+# Read-only view of the region codes
+REGION_CODES = MappingProxyType(_REGION_CODES)
+
+# Flattened lookup for the client hot path
+REGION_NAME = {code: info['name'] for code, info in REGION_CODES.items()}
+
+# Region list sorted by code, precomputed for TNKBClient.list_regions()
+REGIONS_SORTED = tuple(
+    MappingProxyType({
+        'code': code,
+        'name': info['name'],
+        'province': info.get('province', ''),
+    })
+    for code, info in sorted(REGION_CODES.items())
+)